@@ -1,31 +1,96 @@
 from django.contrib import admin
+from django.contrib.admin.views.main import ChangeList
 from django.contrib.contenttypes.admin import GenericTabularInline
+from django.core.paginator import Paginator
+from django.db import connections
+from django.utils.functional import cached_property
 
 from .models import Restaurant, Rating, Sale, Product, Order, Comment
 
 
+# Use the PostgreSQL planner estimate instead of COUNT(*) on unfiltered lists
+class FasterAdminPaginator(Paginator):
+    @cached_property
+    def count(self):
+        queryset = self.object_list
+        connection = connections[queryset.db]
+
+        if connection.vendor != 'postgresql' or queryset.query.where:
+            return super().count
+
+        with connection.cursor() as cursor:
+            cursor.execute(
+                'SELECT reltuples::bigint FROM pg_class WHERE oid = %s::regclass',
+                [connection.ops.quote_name(queryset.model._meta.db_table)]
+            )
+            row = cursor.fetchone()
+
+        # reltuples is -1 until the table has been analyzed
+        if row is None or row[0] < 0:
+            return super().count
+        return row[0]
+
+
+# Fetch only the list_display columns for the rows shown on the changelist.
+# Actions build their queryset with get_queryset(), so they still get full rows.
+class ListDisplayOnlyChangeList(ChangeList):
+    def get_results(self, request):
+        field_names = {
+            field.name for field in self.model._meta.concrete_fields}
+        fields = [name for name in self.list_display if name != 'action_checkbox']
+        # callables and methods may read any field, so only narrow plain fields
+        if all(name in field_names for name in fields):
+            self.queryset = self.queryset.only(*fields)
+        super().get_results(request)
+
+
+class ListDisplayOnlyMixin:
+    def get_changelist(self, request, **kwargs):
+        return ListDisplayOnlyChangeList
+
+
 class CommentInline(GenericTabularInline):
     model = Comment
     max_num = 1
 
 
-class RestaurantAdmin(admin.ModelAdmin):
+class RestaurantAdmin(ListDisplayOnlyMixin, admin.ModelAdmin):
     list_display = ('id', 'name')
     inlines = (CommentInline, )
 
 
 @admin.register(Rating)
-class RatingAdmin(admin.ModelAdmin):
+class RatingAdmin(ListDisplayOnlyMixin, admin.ModelAdmin):
     list_display = ('id', 'rating')
     inlines = (CommentInline, )
+    paginator = FasterAdminPaginator
+    show_full_result_count = False
 
 
 class CommentAdmin(admin.ModelAdmin):
     list_display = ('id', 'content_type', 'object_id', 'content_object')
+    list_select_related = ('content_type', )
+    paginator = FasterAdminPaginator
+    show_full_result_count = False
+
+    def get_queryset(self, request):
+        # resolve content_object with one query per content type, not per row
+        return super().get_queryset(request).prefetch_related('content_object')
+
+
+class SaleAdmin(admin.ModelAdmin):
+    list_display = ('id', 'restaurant', 'income', 'expenditure', 'datetime')
+    list_select_related = ('restaurant', )
+    paginator = FasterAdminPaginator
+    show_full_result_count = False
+
+
+class OrderAdmin(admin.ModelAdmin):
+    list_select_related = ('product', )
 
 
 admin.site.register(Restaurant, RestaurantAdmin)
-admin.site.register(Sale)
+admin.site.register(Sale, SaleAdmin)
 admin.site.register(Product)
-admin.site.register(Order)
+admin.site.register(Order, OrderAdmin)
 admin.site.register(Comment, CommentAdmin)
@@ -1,6 +1,7 @@
 import random
 
 from django.core.management.base import BaseCommand
+from django.db import transaction
 from django.contrib.auth.models import User
 from django.utils import timezone
 from core.models import Restaurant, Rating, Sale
@@ -9,14 +10,13 @@ from core.models import Restaurant, Rating, Sale
 class Command(BaseCommand):
     help = 'Creates application data'
 
+    @transaction.atomic
     def handle(self, *args, **kwargs):
         # get or create an admin user
-        user = User.objects.filter(username='admin')
-        if not user.exists():
+        user = User.objects.filter(username='admin').first()
+        if user is None:
             user = User.objects.create_superuser(
                 username='admin', password='test', email='')
-        else:
-            user = user.first()
 
         restaurants = [
             {'name': 'Pizzeria 1', 'date_opened': timezone.now() - timezone.timedelta(days=20),
@@ -55,26 +55,30 @@ class Command(BaseCommand):
         # deleted_count, _ = Restaurant.objects.all().delete()
         # print(f"Deleted {deleted_count} restaurants.")
 
-        for r in restaurants:
-            Restaurant.objects.create(**r)  # Unpacking key/value from dict
-            # Printing the restaurant object
-            # new_restaurant = Restaurant.objects.create(**r)
-            # print(new_restaurant)
+        Restaurant.objects.bulk_create(
+            # Unpacking key/value from dict
+            [Restaurant(**r) for r in restaurants]
+        )
 
         restaurants = Restaurant.objects.all()
 
         # create some ratings
-        for _ in range(30):
-            Rating.objects.create(
+        Rating.objects.bulk_create([
+            Rating(
                 restaurant=random.choice(restaurants),
                 user=user,
                 rating=random.randint(1, 5)
             )
+            for _ in range(30)
+        ], batch_size=1000)
 
         # create some sales
-        for _ in range(100):
-            Sale.objects.create(
+        Sale.objects.bulk_create([
+            Sale(
                 restaurant=random.choice(restaurants),
                 income=random.uniform(5, 100),
+                expenditure=random.uniform(5, 100),
                 datetime=timezone.now() - timezone.timedelta(days=random.randint(1, 50))
             )
+            for _ in range(100)
+        ], batch_size=1000)
@@ -0,0 +1,32 @@
+# Generated by Django 5.2.18 on 2026-10-15 21:13
+
+from django.conf import settings
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('contenttypes', '0002_remove_content_type_name'),
+        ('core', '0014_event'),
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='comment',
+            index=models.Index(fields=['content_type', 'object_id'], name='core_commen_content_37d5bd_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='rating',
+            index=models.Index(fields=['rating'], name='core_rating_rating_0a1951_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='restaurant',
+            index=models.Index(fields=['restaurant_type'], name='core_restau_restaur_76838b_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='sale',
+            index=models.Index(fields=['datetime'], name='core_sale_datetim_013ab5_idx'),
+        ),
+    ]
@@ -1,7 +1,6 @@
 from django.db import models
 from django.contrib.auth.models import User
-from django.core.validators import MaxValueValidator, MinValueValidator
-from django.core.exceptions import ValidationError
+from django.core.validators import MaxValueValidator, MinValueValidator, RegexValidator
 from django.db.models.functions import Lower, Greatest
 from django.db.models import Q, F, When, Case, Value
 
@@ -13,9 +12,8 @@ from django.utils import timezone
 from datetime import datetime
 
 
-def start_with_a_validator(name: str):
-    if not name.lower().startswith('a'):
-        raise ValidationError('Restaurant name must start with a')
+start_with_a_validator = RegexValidator(
+    r'^[Aa]', message='Restaurant name must start with a')
 
 
 class Restaurant(models.Model):
@@ -31,6 +29,9 @@ class Restaurant(models.Model):
     class Meta:
         ordering = (Lower('name'), )
         get_latest_by = ('date_opened')
+        indexes = [
+            models.Index(fields=['restaurant_type']),
+        ]
 
         constraints = [
             models.CheckConstraint(
@@ -43,6 +44,7 @@ class Restaurant(models.Model):
                 name='valid_longitude',
                 violation_error_message='Latitude must be between -180 and 180'
             ),
+            # the unique index on LOWER(name) also serves the default ordering
             models.UniqueConstraint(
                 Lower('name'), name='restaurant_name_unique_insensitive'
             )
@@ -83,10 +85,6 @@ class Restaurant(models.Model):
     def __str__(self):
         return self.name
 
-    def save(self, *args, **kwargs):
-        print(self._state.adding)
-        super().save(*args, **kwargs)
-
 
 class Staff(models.Model):
     name = models.CharField(max_length=128)
@@ -113,6 +111,9 @@ class Rating(models.Model):
     comments = GenericRelation('Comment')
 
     class Meta:
+        indexes = [
+            models.Index(fields=['rating']),
+        ]
         constraints = [
             models.CheckConstraint(
                 name='rating_valid_value',
@@ -147,6 +148,11 @@ class Sale(models.Model):
         db_persist=True
     )
 
+    class Meta:
+        indexes = [
+            models.Index(fields=['datetime']),
+        ]
+
 
 class Product(models.Model):
     name = models.CharField(max_length=255)
@@ -170,6 +176,11 @@ class Comment(models.Model):
     object_id = models.PositiveBigIntegerField()
     content_object = GenericForeignKey('content_type', 'object_id')
 
+    class Meta:
+        indexes = [
+            models.Index(fields=['content_type', 'object_id']),
+        ]
+
 
 class Event(models.Model):
     name = models.CharField(max_length=255)
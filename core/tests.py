@@ -1,6 +1,14 @@
+from django.contrib.auth.models import User
+from django.core.cache import cache
+from django.core.exceptions import ValidationError
+from django.db import connection
 from django.test import TestCase
+from django.test.utils import CaptureQueriesContext
+from django.urls import reverse
 from django.utils import timezone
-from .models import Restaurant
+from .admin import FasterAdminPaginator
+from .forms import ProductStockException
+from .models import Restaurant, Product, Order, Rating, start_with_a_validator
 
 
 class RestaurantTests(TestCase):
@@ -11,13 +19,21 @@ class RestaurantTests(TestCase):
         restaurant.nickname = 'Cool nickname'
         self.assertEqual(restaurant.restaurant_name, 'Cool nickname')
 
+    def test_name_must_start_with_a(self):
+        start_with_a_validator('Arepas')
+        start_with_a_validator('arepas')
+
+        with self.assertRaises(ValidationError):
+            start_with_a_validator('Pizzeria')
+
     def test_was_opened_this_year_property(self):
+        current_year = timezone.now().year
         restaurant = Restaurant(
-            name='Test', date_opened=timezone.datetime(2024, 12, 12).date())
+            name='Test', date_opened=timezone.datetime(current_year - 1, 12, 12).date())
 
         self.assertEqual(restaurant.was_opened_this_year, False)
 
-        restaurant.date_opened = timezone.datetime(2025, 4, 17).date()
+        restaurant.date_opened = timezone.datetime(current_year, 4, 17).date()
         self.assertEqual(restaurant.was_opened_this_year, True)
 
     def test_was_opened_after(self):
@@ -32,3 +48,126 @@ class RestaurantTests(TestCase):
             timezone.datetime.now() + timezone.timedelta(days=5)
         )
         self.assertEqual(is_open_after, False)
+
+
+class RestaurantDetailViewTests(TestCase):
+    def test_restaurant_detail_uses_url_pk(self):
+        restaurant = Restaurant.objects.create(
+            name='Test', date_opened=timezone.now().date(), latitude=0,
+            longitude=0, restaurant_type=Restaurant.TypeChoices.ITALIAN)
+
+        with self.assertNumQueries(1):
+            response = self.client.get(restaurant.get_absolute_url())
+        self.assertEqual(response.context['restaurant'], restaurant)
+
+        response = self.client.get(
+            reverse('core:restaurant_detail', kwargs={'pk': restaurant.pk + 1}))
+        self.assertEqual(response.status_code, 404)
+
+
+class OrderProductViewTests(TestCase):
+    def test_order_product_decrements_stock(self):
+        product = Product.objects.create(name='Pizza', number_in_stock=10)
+
+        response = self.client.post(
+            reverse('core:order_product'),
+            {'product': product.pk, 'number_of_items': 3})
+
+        self.assertRedirects(response, reverse('core:order_product'))
+        product.refresh_from_db()
+        self.assertEqual(product.number_in_stock, 7)
+        self.assertEqual(Order.objects.get().number_of_items, 3)
+
+    def test_order_product_rejects_insufficient_stock(self):
+        product = Product.objects.create(name='Pizza', number_in_stock=2)
+
+        with self.assertRaises(ProductStockException):
+            self.client.post(
+                reverse('core:order_product'),
+                {'product': product.pk, 'number_of_items': 3})
+
+        product.refresh_from_db()
+        self.assertEqual(product.number_in_stock, 2)
+        self.assertFalse(Order.objects.exists())
+
+
+class IndexViewTests(TestCase):
+    def setUp(self):
+        cache.clear()
+
+    def test_index_response_is_cached(self):
+        with self.assertNumQueries(1):
+            self.client.get(reverse('core:index'))
+
+        with self.assertNumQueries(0):
+            response = self.client.get(reverse('core:index'))
+        self.assertEqual(response.status_code, 200)
+
+
+class RestaurantAdminTests(TestCase):
+    def setUp(self):
+        self.client.force_login(User.objects.create_superuser(
+            username='admin', password='test', email=''))
+        self.restaurant = Restaurant.objects.create(
+            name='Test', date_opened=timezone.now().date(), latitude=0,
+            longitude=0, restaurant_type=Restaurant.TypeChoices.ITALIAN)
+
+    def test_changelist_selects_list_display_columns(self):
+        with CaptureQueriesContext(connection) as queries:
+            response = self.client.get(reverse('admin:core_restaurant_changelist'))
+
+        self.assertEqual(response.status_code, 200)
+        results = [q['sql'] for q in queries
+                   if q['sql'].startswith('SELECT "core_restaurant"."id"')]
+        self.assertEqual(len(results), 1)
+        self.assertIn('"core_restaurant"."name" FROM', results[0])
+        self.assertNotIn('"core_restaurant"."website"', results[0])
+
+    def test_actions_receive_full_rows(self):
+        response = self.client.post(
+            reverse('admin:core_restaurant_changelist'),
+            {'action': 'delete_selected', '_selected_action': [self.restaurant.pk]})
+
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(
+            response.context['queryset'].query.deferred_loading, (frozenset(), True))
+
+
+class FasterAdminPaginatorTests(TestCase):
+    def setUp(self):
+        user = User.objects.create_user(username='user', password='test')
+        restaurant = Restaurant.objects.create(
+            name='Test', date_opened=timezone.now().date(), latitude=0,
+            longitude=0, restaurant_type=Restaurant.TypeChoices.ITALIAN)
+        Rating.objects.bulk_create(
+            Rating(user=user, restaurant=restaurant, rating=rating)
+            for rating in (1, 3, 5, 5)
+        )
+
+    def test_count_falls_back_to_count_query_on_sqlite(self):
+        paginator = FasterAdminPaginator(Rating.objects.order_by('pk'), 100)
+
+        with self.assertNumQueries(1):
+            count = paginator.count
+        self.assertEqual(count, Rating.objects.count())
+
+    def test_count_falls_back_for_filtered_queryset(self):
+        paginator = FasterAdminPaginator(
+            Rating.objects.filter(rating=5).order_by('pk'), 100)
+
+        self.assertEqual(paginator.count, 2)
+
+    def test_changelist_skips_full_result_count(self):
+        self.client.force_login(User.objects.create_superuser(
+            username='admin', password='test', email=''))
+
+        with CaptureQueriesContext(connection) as queries:
+            response = self.client.get(
+                reverse('admin:core_rating_changelist'), {'rating__exact': 5})
+
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(response.context['cl'].result_count, 2)
+        self.assertIsNone(response.context['cl'].full_result_count)
+        counts = [q['sql'] for q in queries
+                  if q['sql'].startswith('SELECT COUNT(*)') and 'core_rating' in q['sql']]
+        self.assertEqual(len(counts), 1)
@@ -1,11 +1,12 @@
 from django.shortcuts import render, redirect, get_object_or_404
-from django.db.models import Sum, Prefetch
+from django.db.models import Sum, Prefetch, F
 from django.utils import timezone
 from django.db import transaction
+from django.views.decorators.cache import cache_page
 from functools import partial
 
-from .models import Restaurant, Sale, StaffRestaurants
-from .forms import ProductOrderForm
+from .models import Restaurant, Sale, StaffRestaurants, Product
+from .forms import ProductOrderForm, ProductStockException
 
 
 def email_user(email: str):
@@ -13,6 +14,7 @@ def email_user(email: str):
         f'Dear user, thank you for your oder. Sending confirmation to {email}')
 
 
+@cache_page(60 * 5)
 def index(request):
     restaurants = Restaurant.objects.all()[:5]
 
@@ -35,9 +37,15 @@ def order_product(request):
                 # import sys
                 # sys.exit(1)
 
-                product = order.product
-                product.number_in_stock -= order.number_of_items
-                product.save()
+                # only decrement when enough items are left, in a single UPDATE
+                updated = Product.objects.filter(
+                    pk=order.product_id,
+                    number_in_stock__gte=order.number_of_items
+                ).update(
+                    number_in_stock=F('number_in_stock') - order.number_of_items)
+                if not updated:
+                    raise ProductStockException(
+                        f'Not enough items in stock for the product {order.product.name}')
             transaction.on_commit(partial(email_user, 'example@emai.com'))
 
             return redirect('core:order_product')
@@ -54,7 +62,7 @@ def order_product(request):
 
 
 def restaurant_detail(request, pk):
-    restaurant = get_object_or_404(Restaurant, pk=7)
+    restaurant = get_object_or_404(Restaurant, pk=pk)
     context = {
         'restaurant': restaurant
     }